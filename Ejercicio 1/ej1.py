@@ -1,5 +1,11 @@
+import argparse
+import time
 import pulp
 
+# Solvers de pulp que reciben el modelo en memoria, sin escribir un archivo
+# MPS/LP ni lanzar un proceso aparte. Se prueban en este orden.
+SOLVERS_EN_PROCESO = ["HiGHS", "GUROBI", "CPLEX_PY", "XPRESS_PY", "SCIP_PY"]
+
 def imprimir_resultados(modelo, flujo, rutas):
     print(f"Estado: {pulp.LpStatus[modelo.status]}")
     print(f"Enlaces totales usados: {pulp.value(modelo.objective)}")
@@ -9,7 +15,136 @@ def imprimir_resultados(modelo, flujo, rutas):
         if cantidad > 0:
             print(f"Nodo {i} -> Nodo {j}: {cantidad} MB")
 
-def encontrar_ruta_optima(capacidades, nodos, origen, destino, total_archivo):
+def imprimir_tiempos(tiempos):
+    total = sum(tiempos.values())
+    print("-" * 30)
+    for etapa, segundos in tiempos.items():
+        print(f"{etapa.capitalize()}: {segundos * 1000:.3f} ms")
+    print(f"Total: {total * 1000:.3f} ms")
+
+
+def crear_solver(backend="PULP_CBC_CMD", hilos=None, mensajes=True):
+    """
+    Crea el solver de pulp indicado por backend. Con backend="en_proceso"
+    se usa el primer solver instalado de SOLVERS_EN_PROCESO que acepte las
+    opciones pedidas y, si no hay ninguno, se vuelve a CBC.
+
+    Raises:
+        ValueError: Si hilos es menor a 1
+        pulp.PulpSolverError: Si el solver no existe, no permite elegir la
+                              cantidad de hilos o no está instalado
+    """
+    if hilos is not None and hilos < 1:
+        raise ValueError("La cantidad de hilos debe ser al menos 1")
+
+    opciones = {"msg": mensajes}
+    if hilos is not None:
+        opciones["threads"] = hilos
+
+    if backend == "en_proceso":
+        for nombre in SOLVERS_EN_PROCESO:
+            try:
+                solver = pulp.getSolver(nombre, **opciones)
+            except (TypeError, pulp.PulpSolverError):
+                continue
+            if solver.available():
+                return solver
+        backend = "PULP_CBC_CMD"
+
+    if backend not in pulp.listSolvers():
+        raise pulp.PulpSolverError(f"El solver {backend} no existe en pulp")
+    try:
+        solver = pulp.getSolver(backend, **opciones)
+    except TypeError:
+        raise pulp.PulpSolverError(f"El solver {backend} no permite elegir la cantidad de hilos")
+    if not solver.available():
+        raise pulp.PulpSolverError(f"El solver {backend} no está disponible")
+    return solver
+
+
+def _cronometrar(objeto, metodo, tiempos, etapa, en_curso):
+    # reemplaza el método solo en esta instancia, acumulando su duración en tiempos[etapa].
+    # en_curso cuenta los métodos envueltos que se están midiendo: si uno llama a otro
+    # (por ejemplo, CYLP.buildSolverModel llama a writeMPS) solo se mide el externo
+    original = getattr(objeto, metodo, None)
+    if original is None:
+        return False
+
+    def cronometrado(*args, **kwargs):
+        if en_curso[0]:
+            return original(*args, **kwargs)
+        en_curso[0] += 1
+        inicio = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            tiempos[etapa] += time.perf_counter() - inicio
+            en_curso[0] -= 1
+
+    setattr(objeto, metodo, cronometrado)
+    return True
+
+
+def resolver(modelo, solver, tiempos=None):
+    """
+    Resuelve el modelo con el solver dado. Si se pasa el diccionario tiempos,
+    se completa con la duración de cada etapa:
+        exportacion: escritura de los archivos MPS/LP y de la solución
+                     inicial, o carga del modelo en memoria para los
+                     solvers en proceso
+        resolucion: ejecución del solver (incluye lanzar el proceso)
+        lectura: lectura de la solución de vuelta al modelo
+    """
+    if tiempos is None:
+        return modelo.solve(solver)
+
+    tiempos["exportacion"] = 0.0
+    tiempos["resolucion"] = 0.0
+    tiempos["lectura"] = 0.0
+    etapas = [
+        (modelo, ("writeMPS", "writeLP"), "exportacion"),
+        (solver, ("writesol", "buildSolverModel"), "exportacion"),
+        (solver, ("readsol_MPS", "readsol", "findSolutionValues"), "lectura"),
+    ]
+    envueltos = []
+    en_curso = [0]
+    for objeto, metodos, etapa in etapas:
+        for metodo in metodos:
+            previo = objeto.__dict__.get(metodo)
+            if _cronometrar(objeto, metodo, tiempos, etapa, en_curso):
+                envueltos.append((objeto, metodo, previo))
+
+    inicio = time.perf_counter()
+    try:
+        return modelo.solve(solver)
+    finally:
+        total = time.perf_counter() - inicio
+        tiempos["resolucion"] = total - tiempos["exportacion"] - tiempos["lectura"]
+        # se quitan los envoltorios para no dejar el modelo ni el solver modificados
+        for objeto, metodo, previo in envueltos:
+            if previo is None:
+                objeto.__dict__.pop(metodo, None)
+            else:
+                objeto.__dict__[metodo] = previo
+
+
+def encontrar_ruta_optima(capacidades, nodos, origen, destino, total_archivo,
+                          backend="PULP_CBC_CMD", hilos=None, mensajes=True, tiempos=None,
+                          solver=None):
+    """
+    Minimiza la cantidad de enlaces usados para enviar total_archivo MB
+    desde origen hasta destino.
+
+    Args:
+        backend: Nombre de un solver de pulp, o "en_proceso"
+        hilos: Cantidad de hilos del solver (None usa el valor del solver)
+        mensajes: Si el solver muestra su log por consola
+        tiempos: Diccionario opcional que se completa con la duración de
+                 construccion, exportacion, resolucion y lectura
+        solver: Solver de pulp ya creado; si se indica, se ignoran
+                backend, hilos y mensajes
+    """
+    inicio = time.perf_counter()
     modelo = pulp.LpProblem("Ruta_Optima", pulp.LpMinimize)
 
     rutas = capacidades.keys()
@@ -32,11 +167,26 @@ def encontrar_ruta_optima(capacidades, nodos, origen, destino, total_archivo):
         else:
             modelo += (entra == sale)
 
-    modelo.solve()
+    if tiempos is not None:
+        tiempos["construccion"] = time.perf_counter() - inicio
+
+    if solver is None:
+        solver = crear_solver(backend, hilos, mensajes)
+    resolver(modelo, solver, tiempos)
     return modelo, flujo, rutas
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Ruta óptima con programación lineal")
+    parser.add_argument("--backend", default="PULP_CBC_CMD", metavar="SOLVER",
+                        choices=pulp.listSolvers() + ["en_proceso"],
+                        help='Solver de pulp a usar, o "en_proceso" (por defecto, PULP_CBC_CMD)')
+    parser.add_argument("--hilos", type=int, help="Cantidad de hilos del solver")
+    parser.add_argument("--tiempos", action="store_true",
+                        help="Mostrar el tiempo de cada etapa de la resolución")
+    args = parser.parse_args()
+    if args.hilos is not None and args.hilos < 1:
+        parser.error("--hilos debe ser al menos 1")
 
     capacidades = {
         (1, 2): 5, (1, 3): 5,
@@ -55,9 +205,22 @@ def main():
     destino = 10
     total_archivo = 10
 
-    modelo, flujo, rutas = encontrar_ruta_optima(capacidades, nodos, origen, destino, total_archivo)
+    try:
+        solver = crear_solver(args.backend, args.hilos)
+    except pulp.PulpSolverError as e:
+        parser.error(str(e))
+
+    tiempos = {} if args.tiempos else None
+    modelo, flujo, rutas = encontrar_ruta_optima(
+        capacidades, nodos, origen, destino, total_archivo,
+        tiempos=tiempos, solver=solver
+    )
     imprimir_resultados(modelo, flujo, rutas)
+    if tiempos is not None:
+        imprimir_tiempos(tiempos)
     
     return 0
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
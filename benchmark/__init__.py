@@ -0,0 +1,11 @@
+"""
+Benchmark común para los solvers de los cuatro ejercicios.
+
+Uso:
+    python -m benchmark [ej1 ej2 ej3 ej4] [--base resultados_base.json]
+"""
+
+from .generadores import GENERADORES, generar_grafo, generar_items, generar_rondas
+from .medicion import ejecutar_benchmark, medir_memoria, medir_tiempos, nuevo_resultado, perfilar
+from .regresion import cargar_resultados, comparar, guardar_resultados
+from .solvers import SOLVERS, TAMAÑOS_POR_DEFECTO
@@ -0,0 +1,106 @@
+import argparse
+import os
+import sys
+
+from .medicion import ejecutar_benchmark, nuevo_resultado
+from .modulos import cargar_modulo
+from .regresion import cargar_resultados, comparar, guardar_resultados
+from .solvers import SOLVERS, TAMAÑOS_POR_DEFECTO
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmark',
+        description='Benchmark común de los solvers de los cuatro ejercicios'
+    )
+    parser.add_argument('solvers', nargs='*', metavar='SOLVER',
+                        help=f"Solvers a medir entre {', '.join(SOLVERS)} (por defecto, todos)")
+    parser.add_argument('-n', '--tamaños', type=int, nargs='+',
+                        help='Tamaños de instancia (por defecto, los de cada solver)')
+    parser.add_argument('-r', '--repeticiones', type=int, default=5,
+                        help='Ejecuciones medidas por tamaño')
+    parser.add_argument('-s', '--semilla', type=int, default=42,
+                        help='Semilla de los generadores de instancias')
+    parser.add_argument('-o', '--salida', default='benchmark_resultados.json',
+                        help='Archivo JSON de salida')
+    parser.add_argument('--perfiles', metavar='DIR',
+                        help='Guardar volcados de cProfile en DIR')
+    parser.add_argument('--backend-ej1', default='PULP_CBC_CMD', metavar='SOLVER',
+                        help='Solver de pulp para ej1, o "en_proceso" (por defecto, PULP_CBC_CMD)')
+    parser.add_argument('--hilos-ej1', type=int, metavar='N',
+                        help='Cantidad de hilos del solver de ej1')
+    parser.add_argument('--base', metavar='ARCHIVO',
+                        help='Resultados de referencia contra los cuales comparar')
+    parser.add_argument('--tolerancia', type=float, default=0.2,
+                        help='Aumento relativo permitido antes de reportar una regresión')
+    args = parser.parse_args()
+
+    desconocidos = [nombre for nombre in args.solvers if nombre not in SOLVERS]
+    if desconocidos:
+        parser.error(f"solver desconocido: {', '.join(desconocidos)}")
+    if args.repeticiones < 1:
+        parser.error('--repeticiones debe ser al menos 1')
+    if args.hilos_ej1 is not None and args.hilos_ej1 < 1:
+        parser.error('--hilos-ej1 debe ser al menos 1')
+    if args.tolerancia < 0:
+        parser.error('--tolerancia no puede ser negativa')
+
+    solvers = args.solvers or list(SOLVERS)
+    if args.tamaños:
+        for nombre in solvers:
+            minimo = SOLVERS[nombre]['tamaño_minimo']
+            if min(args.tamaños) < minimo:
+                parser.error(f"los tamaños de {nombre} deben ser al menos {minimo}")
+    opciones = {}
+    if 'ej1' in solvers:
+        # se resuelve el backend antes de medir, para fallar temprano y
+        # registrar el solver realmente usado en lugar de "en_proceso"
+        ej1 = cargar_modulo('ej1', os.path.join('Ejercicio 1', 'ej1.py'))
+        try:
+            solver = ej1.crear_solver(args.backend_ej1, args.hilos_ej1, mensajes=False)
+        except ej1.pulp.PulpSolverError as e:
+            parser.error(str(e))
+        opciones['ej1'] = {'backend': solver.name, 'hilos': args.hilos_ej1}
+
+    resultados = nuevo_resultado()
+    for nombre in solvers:
+        tamaños = args.tamaños or TAMAÑOS_POR_DEFECTO[nombre]
+        resultados['solvers'][nombre] = ejecutar_benchmark(
+            nombre, tamaños, args.repeticiones, args.semilla, args.perfiles,
+            opciones.get(nombre)
+        )
+
+    guardar_resultados(resultados, args.salida)
+
+    if args.base is None:
+        return 0
+
+    try:
+        regresiones, sin_base = comparar(resultados, cargar_resultados(args.base), args.tolerancia)
+    except ValueError as e:
+        print(f"No se puede comparar con {args.base}: {e}")
+        return 2
+
+    total = sum(len(mediciones) for mediciones in resultados['solvers'].values())
+    if sin_base:
+        print(f"Mediciones sin referencia en {args.base}:")
+        for m in sin_base:
+            print(f"  {m['solver']} n={m['n']}")
+    if len(sin_base) == total:
+        print(f"Ninguna medición coincide con {args.base} (tamaño, semilla u opciones distintos)")
+        return 2
+
+    if not regresiones:
+        print(f"Sin regresiones respecto de {args.base} "
+              f"({total - len(sin_base)} mediciones comparadas)")
+        return 0
+
+    print(f"Regresiones respecto de {args.base}:")
+    for r in regresiones:
+        print(f"  {r['solver']} n={r['n']} {r['metrica']}: "
+              f"{r['base']:.6g} -> {r['actual']:.6g} (x{r['ratio']:.2f})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
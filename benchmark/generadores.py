@@ -0,0 +1,93 @@
+import os
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .modulos import cargar_modulo
+
+
+def generar_grafo(n: int, semilla: Optional[int] = None, densidad: float = 0.3) -> Dict:
+    """
+    Genera una red aleatoria de n nodos con aristas orientadas de menor a
+    mayor nodo. Siempre incluye el camino 1 -> 2 -> ... -> n, de modo que
+    el archivo puede enviarse completo desde el origen hasta el destino.
+
+    Args:
+        n: Número de nodos (n >= 2)
+        semilla: Semilla para reproducibilidad
+        densidad: Probabilidad de agregar cada arista fuera del camino base
+
+    Returns:
+        Diccionario con 'capacidades', 'nodos', 'origen', 'destino'
+        y 'total_archivo'
+    """
+    if n < 2:
+        raise ValueError("La red necesita al menos 2 nodos")
+
+    rng = random.Random(semilla)
+    nodos = list(range(1, n + 1))
+    capacidades = {}
+
+    for i in range(1, n):
+        capacidades[(i, i + 1)] = rng.randint(1, 10)
+
+    for i in range(1, n + 1):
+        for j in range(i + 2, n + 1):
+            if rng.random() < densidad:
+                capacidades[(i, j)] = rng.randint(1, 10)
+
+    # el camino base tiene capacidad suficiente para todo el archivo
+    total_archivo = min(capacidades[(i, i + 1)] for i in range(1, n))
+
+    return {
+        'capacidades': capacidades,
+        'nodos': nodos,
+        'origen': 1,
+        'destino': n,
+        'total_archivo': total_archivo
+    }
+
+
+def generar_items(n: int, semilla: Optional[int] = None) -> List[float]:
+    """
+    Genera n objetos con tamaños aleatorios en (0, 1) usando el mismo
+    generador del Ejercicio 3.
+
+    Args:
+        n: Número de objetos
+        semilla: Semilla para reproducibilidad
+
+    Returns:
+        Lista de tamaños de objetos
+    """
+    bin_packing = cargar_modulo('bin_packing', os.path.join('Ejercicio 3', 'bin_packing.py'))
+    return bin_packing.generate_dataset(n, seed=semilla)
+
+
+def generar_rondas(n: int, semilla: Optional[int] = None) -> Dict:
+    """
+    Genera una instancia del protocolo de Conocimiento Cero con n rondas.
+    La semilla se guarda para fijar el estado de `random` antes de cada
+    ejecución, ya que el protocolo usa el generador global.
+
+    Args:
+        n: Número de rondas
+        semilla: Semilla para reproducibilidad
+
+    Returns:
+        Diccionario con 'n_repeticiones', 'peggy_sabe' y 'semilla'
+    """
+    return {'n_repeticiones': n, 'peggy_sabe': True, 'semilla': semilla}
+
+
+def aristas_desde_capacidades(capacidades: Dict[Tuple[int, int], int]) -> List[Tuple[int, int, int]]:
+    """Convierte el diccionario de capacidades al formato de lista del Ejercicio 2"""
+    return [(u, v, cap) for (u, v), cap in capacidades.items()]
+
+
+# Generadores de instancias disponibles. Para agregar uno nuevo basta con
+# registrarlo acá y referenciar su clave desde SOLVERS.
+GENERADORES: Dict[str, Callable] = {
+    'grafo': generar_grafo,
+    'items': generar_items,
+    'rondas': generar_rondas,
+}
@@ -0,0 +1,138 @@
+import cProfile
+import functools
+import gc
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from .generadores import GENERADORES
+from .solvers import SOLVERS
+
+
+VERSION_ESQUEMA = 2
+
+
+def medir_tiempos(funcion: Callable, instancia, repeticiones: int) -> List[float]:
+    """
+    Mide el tiempo de `repeticiones` ejecuciones de funcion(instancia).
+    Se hace una ejecución previa sin medir para cargar módulos y cachés.
+
+    Returns:
+        Lista con el tiempo en segundos de cada ejecución
+    """
+    funcion(instancia)
+
+    tiempos = []
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            funcion(instancia)
+            fin = time.perf_counter()
+            tiempos.append(fin - inicio)
+    finally:
+        if gc_activo:
+            gc.enable()
+    return tiempos
+
+
+def medir_memoria(funcion: Callable, instancia) -> int:
+    """
+    Devuelve el pico de memoria (en bytes) reservada durante una ejecución,
+    según tracemalloc. Se mide aparte de los tiempos porque tracemalloc
+    agrega overhead a cada reserva de memoria.
+
+    tracemalloc solo ve las reservas del heap de Python. En el Ejercicio 1
+    no cuenta la memoria del proceso de CBC ni la memoria nativa de los
+    solvers en proceso, así que el valor refleja la construcción del modelo
+    en PuLP y no al solver.
+    """
+    tracemalloc.start()
+    try:
+        funcion(instancia)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def perfilar(funcion: Callable, instancia, archivo: str):
+    """Ejecuta funcion(instancia) bajo cProfile y guarda el volcado en archivo"""
+    perfil = cProfile.Profile()
+    perfil.runcall(funcion, instancia)
+    perfil.dump_stats(archivo)
+
+
+def ejecutar_benchmark(nombre: str, tamaños: List[int], repeticiones: int = 5,
+                       semilla: int = 42, dir_perfiles: Optional[str] = None,
+                       opciones: Optional[Dict] = None) -> List[Dict]:
+    """
+    Ejecuta el benchmark de un solver para cada tamaño de entrada.
+
+    Args:
+        nombre: Clave del solver en SOLVERS ('ej1', 'ej2', 'ej3', 'ej4')
+        tamaños: Tamaños de instancia a generar
+        repeticiones: Ejecuciones medidas por tamaño
+        semilla: Semilla de los generadores de instancias
+        dir_perfiles: Si se indica, guarda un volcado de cProfile por tamaño
+        opciones: Argumentos extra para el solver (por ejemplo, el backend
+                  de ej1), que se registran en cada medición
+
+    Returns:
+        Lista de mediciones, una por tamaño, con el esquema común
+    """
+    solver = SOLVERS[nombre]
+    opciones = opciones or {}
+    mediciones = []
+
+    for n in tamaños:
+        print(f"[{nombre}] n={n}...")
+        generador = GENERADORES[solver['generador']]
+        instancia = solver['preparar'](generador(n, semilla))
+        ejecutar = functools.partial(solver['ejecutar'], **opciones)
+
+        tiempos = medir_tiempos(ejecutar, instancia, repeticiones)
+        pico = medir_memoria(ejecutar, instancia)
+
+        perfil = None
+        if dir_perfiles is not None:
+            os.makedirs(dir_perfiles, exist_ok=True)
+            perfil = os.path.join(dir_perfiles, f"{nombre}_n{n}.prof")
+            perfilar(ejecutar, instancia, perfil)
+
+        medicion = {
+            'n': n,
+            'semilla': semilla,
+            'generador': solver['generador'],
+            'opciones': opciones,
+            'repeticiones': repeticiones,
+            'tiempos': tiempos,
+            'tiempo_min': min(tiempos),
+            'tiempo_mediana': statistics.median(tiempos),
+            'tiempo_promedio': statistics.mean(tiempos),
+            'tiempo_desvio': statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+            'memoria_pico_bytes': pico,
+            'perfil': perfil
+        }
+        mediciones.append(medicion)
+
+        print(f"  Mediana: {medicion['tiempo_mediana'] * 1000:.4f}ms, "
+              f"Memoria pico: {pico / 1024:.1f}KiB")
+
+    return mediciones
+
+
+def nuevo_resultado() -> Dict:
+    """Crea el diccionario de resultados con los metadatos de la ejecución"""
+    return {
+        'version': VERSION_ESQUEMA,
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'solvers': {}
+    }
@@ -0,0 +1,22 @@
+import importlib.util
+import os
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_modulos = {}
+
+
+def cargar_modulo(nombre: str, ruta_relativa: str):
+    """
+    Importa un script de ejercicio a partir de su ruta. Los directorios
+    'Ejercicio N' no son paquetes de Python, por lo que no pueden importarse
+    con un import normal.
+    """
+    if nombre not in _modulos:
+        ruta = os.path.join(RAIZ, ruta_relativa)
+        spec = importlib.util.spec_from_file_location(nombre, ruta)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+        _modulos[nombre] = modulo
+    return _modulos[nombre]
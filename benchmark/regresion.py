@@ -0,0 +1,81 @@
+import json
+from typing import Dict, List, Tuple
+
+from .medicion import VERSION_ESQUEMA
+
+
+def cargar_resultados(nombre_archivo: str) -> Dict:
+    """Lee un archivo de resultados con el esquema común"""
+    with open(nombre_archivo, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def guardar_resultados(resultados: Dict, nombre_archivo: str):
+    """Guarda los resultados en formato JSON"""
+    with open(nombre_archivo, 'w', encoding='utf-8') as f:
+        json.dump(resultados, f, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en: {nombre_archivo}")
+
+
+def _clave(medicion: Dict) -> Tuple:
+    # dos mediciones son comparables solo si se hicieron sobre la misma
+    # instancia y con las mismas opciones del solver
+    opciones = json.dumps(medicion.get('opciones', {}), sort_keys=True)
+    return (medicion['n'], medicion['semilla'], medicion['generador'], opciones)
+
+
+def comparar(actual: Dict, base: Dict, tolerancia: float = 0.2) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Compara dos resultados y devuelve las regresiones encontradas junto con
+    las mediciones que no tienen referencia en la base.
+    Se usa el tiempo mínimo de cada medición, que es el menos sensible al
+    ruido del sistema. Solo se comparan las mediciones del mismo solver
+    hechas sobre la misma instancia (mismo n, semilla y generador) y con
+    las mismas opciones.
+
+    Args:
+        actual: Resultados de la ejecución actual
+        base: Resultados de referencia
+        tolerancia: Aumento relativo permitido (0.2 = 20% más lento)
+
+    Returns:
+        Tupla (regresiones, sin_base). Cada regresión tiene solver, n,
+        métrica y ratio; cada elemento de sin_base tiene el solver y el n
+        de una medición que no se pudo comparar
+
+    Raises:
+        ValueError: Si alguno de los resultados usa otra versión del esquema
+    """
+    for resultados in (actual, base):
+        version = resultados.get('version')
+        if version != VERSION_ESQUEMA:
+            raise ValueError(f"Versión de esquema {version} incompatible "
+                             f"(se esperaba {VERSION_ESQUEMA})")
+
+    regresiones = []
+    sin_base = []
+
+    for nombre, mediciones in actual['solvers'].items():
+        base_por_clave = {_clave(m): m for m in base['solvers'].get(nombre, [])}
+
+        for medicion in mediciones:
+            referencia = base_por_clave.get(_clave(medicion))
+            if referencia is None:
+                sin_base.append({'solver': nombre, 'n': medicion['n']})
+                continue
+
+            for metrica in ('tiempo_min', 'memoria_pico_bytes'):
+                if referencia[metrica] <= 0:
+                    continue
+                ratio = medicion[metrica] / referencia[metrica]
+                if ratio > 1 + tolerancia:
+                    regresiones.append({
+                        'solver': nombre,
+                        'n': medicion['n'],
+                        'metrica': metrica,
+                        'base': referencia[metrica],
+                        'actual': medicion[metrica],
+                        'ratio': ratio
+                    })
+
+    return regresiones, sin_base
@@ -0,0 +1,87 @@
+import os
+import random
+from typing import Dict, Optional
+
+from .generadores import aristas_desde_capacidades
+from .modulos import cargar_modulo
+
+
+def _ejecutar_ej1(instancia: Dict, backend: str = 'PULP_CBC_CMD', hilos: Optional[int] = None):
+    ej1 = cargar_modulo('ej1', os.path.join('Ejercicio 1', 'ej1.py'))
+    return ej1.encontrar_ruta_optima(
+        instancia['capacidades'],
+        instancia['nodos'],
+        instancia['origen'],
+        instancia['destino'],
+        instancia['total_archivo'],
+        backend=backend,
+        hilos=hilos,
+        mensajes=False
+    )
+
+
+def _preparar_ej2(instancia: Dict) -> Dict:
+    return {
+        'grafo': aristas_desde_capacidades(instancia['capacidades']),
+        'tam_archivo': instancia['total_archivo']
+    }
+
+
+def _ejecutar_ej2(instancia: Dict):
+    ej2 = cargar_modulo('ej2', os.path.join('Ejercicio 2', 'ej2.py'))
+    return ej2.enviar_archivo_por_la_red(instancia['grafo'], instancia['tam_archivo'])
+
+
+def _ejecutar_ej3(items):
+    bin_packing = cargar_modulo('bin_packing', os.path.join('Ejercicio 3', 'bin_packing.py'))
+    return bin_packing.first_fit_decreasing(items)
+
+
+def _ejecutar_ej4(instancia: Dict):
+    zkp = cargar_modulo('zero_knowledge_proof', os.path.join('Ejercicio 4', 'zero_knowledge_proof.py'))
+    if instancia['semilla'] is not None:
+        random.seed(instancia['semilla'])
+    prueba = zkp.ZeroKnowledgeProof(peggy_can_distinguish=instancia['peggy_sabe'])
+    return prueba.ejecutar_protocolo(instancia['n_repeticiones'])
+
+
+def _sin_preparar(instancia):
+    return instancia
+
+
+# Cada solver define qué generador de GENERADORES usa para crear sus
+# instancias, el tamaño mínimo que acepta ese generador, cómo adaptarlas a
+# la firma del ejercicio (fuera de la medición) y qué función medir.
+SOLVERS: Dict[str, Dict] = {
+    'ej1': {
+        'generador': 'grafo',
+        'tamaño_minimo': 2,
+        'preparar': _sin_preparar,
+        'ejecutar': _ejecutar_ej1,
+    },
+    'ej2': {
+        'generador': 'grafo',
+        'tamaño_minimo': 2,
+        'preparar': _preparar_ej2,
+        'ejecutar': _ejecutar_ej2,
+    },
+    'ej3': {
+        'generador': 'items',
+        'tamaño_minimo': 1,
+        'preparar': _sin_preparar,
+        'ejecutar': _ejecutar_ej3,
+    },
+    'ej4': {
+        'generador': 'rondas',
+        'tamaño_minimo': 1,
+        'preparar': _sin_preparar,
+        'ejecutar': _ejecutar_ej4,
+    },
+}
+
+TAMAÑOS_POR_DEFECTO: Dict[str, list] = {
+    'ej1': [10, 20, 40, 80],
+    'ej2': [10, 50, 100, 200],
+    'ej3': [100, 500, 1000, 2000],
+    'ej4': [10, 100, 1000, 10000],
+}